@@ -357,6 +357,58 @@ def test_convert_office_doc_captures_errors(monkeypatch, caplog):
     assert "soffice failed to convert to format docx with code 1" in caplog.text
 
 
+def test_convert_office_doc_runs_soffice_with_start_up_flags_and_extra_args(monkeypatch):
+    from unstructured.partition.common import subprocess
+
+    commands = []
+
+    def mock_run(command, **kwargs):
+        commands.append(command)
+        return MockRunOutput(0, "convert ok".encode(), b"")
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+    common.convert_office_doc(
+        "simple.doc",
+        "fake-directory",
+        target_format="docx",
+        soffice_extra_args=["-env:UserInstallation=file:///tmp/profile"],
+    )
+
+    assert commands == [
+        [
+            "soffice",
+            "--headless",
+            "--norestore",
+            "--nolockcheck",
+            "--nodefault",
+            "--nofirststartwizard",
+            "-env:UserInstallation=file:///tmp/profile",
+            "--convert-to",
+            "docx",
+            "--outdir",
+            "fake-directory",
+            "simple.doc",
+        ]
+    ]
+
+
+def test_convert_office_doc_retries_while_only_a_resident_soffice_is_running(monkeypatch):
+    from unstructured.partition.common import subprocess
+
+    outputs = [MockRunOutput(0, b"", b""), MockRunOutput(0, "convert ok".encode(), b"")]
+    monkeypatch.setattr(subprocess, "run", lambda command, **kwargs: outputs.pop(0))
+    resident_soffice = mock.Mock(pid=4242)
+    resident_soffice.name.return_value = "soffice.bin"
+    monkeypatch.setattr(common.psutil, "process_iter", lambda: [resident_soffice])
+    monkeypatch.setattr(common.psutil, "Process", mock.Mock())
+    monkeypatch.setattr(common, "_resident_soffice_pids", {4242})
+    monkeypatch.setattr(common, "sleep", mock.Mock(side_effect=AssertionError("slept")))
+
+    common.convert_office_doc("simple.doc", "fake-directory", target_format="docx")
+
+    assert outputs == []
+
+
 def test_convert_office_docs_avoids_concurrent_call_to_soffice():
     paths_to_save = [pathlib.Path(path) for path in ("/tmp/proc1", "/tmp/proc2", "/tmp/proc3")]
     for path in paths_to_save:
@@ -667,6 +719,25 @@ class Describe_get_last_modified_date:
         assert last_modified_date is None
 
 
+class Describe_get_last_modified_date_from_stat:
+    def it_gets_the_modified_time_from_the_stat_result_of_a_file(self, tmp_path: pathlib.Path):
+        modified_timestamp = dt.datetime(
+            year=2024, month=3, day=5, hour=17, minute=43, second=40
+        ).timestamp()
+        file_path = tmp_path / "some_file.txt"
+        file_path.write_text("abcdefg")
+        os.utime(file_path, (modified_timestamp, modified_timestamp))
+
+        last_modified_date = common.get_last_modified_date_from_stat(os.stat(file_path))
+
+        assert last_modified_date == "2024-03-05T17:43:40"
+
+    def but_it_returns_None_when_the_stat_result_is_not_for_a_regular_file(
+        self, tmp_path: pathlib.Path
+    ):
+        assert common.get_last_modified_date_from_stat(os.stat(tmp_path)) is None
+
+
 class Describe_get_last_modified_date_from_file:
     def it_gets_the_modified_time_of_a_file_like_object_corresponding_to_a_filesystem_file(
         self, tmp_path: pathlib.Path
@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import io
+import logging
+import os
 import pathlib
-from typing import Any
+import shutil
+import threading
+from types import SimpleNamespace
+from typing import Any, Callable
+from unittest.mock import ANY, Mock
 
 import pytest
 from pytest_mock import MockFixture
@@ -14,6 +21,8 @@ from test_unstructured.unit_utils import (
     assert_round_trips_through_JSON,
     example_doc_path,
     function_mock,
+    instance_mock,
+    method_mock,
 )
 from unstructured.chunking.basic import chunk_elements
 from unstructured.documents.elements import (
@@ -27,15 +36,23 @@ from unstructured.documents.elements import (
     Text,
     Title,
 )
-from unstructured.partition.doc import partition_doc
+from unstructured.partition.doc import (
+    _copy_file_contents,
+    _DeferredDirRemover,
+    _scratch_dir,
+    _SofficeDaemon,
+    _SofficeProfilePool,
+    clear_doc_conversion_cache,
+    partition_doc,
+    partition_docs,
+)
 from unstructured.partition.docx import partition_docx
 
 
-def test_partition_doc_matches_partition_docx(request: FixtureRequest):
-    doc_file_path = example_doc_path("simple.doc")
+def test_partition_doc_matches_partition_docx(simple_doc_elements: list[Element]):
     docx_file_path = example_doc_path("simple.docx")
 
-    assert partition_doc(doc_file_path) == partition_docx(docx_file_path)
+    assert simple_doc_elements == partition_docx(docx_file_path)
 
 
 # -- document-source (file or filename) ----------------------------------------------------------
@@ -95,6 +112,631 @@ def test_partition_raises_with_missing_doc(tmp_path: pathlib.Path):
         partition_doc(filename=doc_filename)
 
 
+def test_partition_doc_writes_a_file_like_object_to_disk_for_conversion(
+    request: FixtureRequest, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("UNSTRUCTURED_SOFFICE_DAEMON", "0")
+    written_bytes: list[bytes] = []
+
+    def fake_convert_office_doc(input_filename: str, *args: Any, **kwargs: Any):
+        with open(input_filename, "rb") as f:
+            written_bytes.append(f.read())
+
+    function_mock(
+        request,
+        "unstructured.partition.doc.convert_office_doc",
+        side_effect=fake_convert_office_doc,
+    )
+    function_mock(request, "unstructured.partition.docx.partition_docx", return_value=[])
+    with open(example_doc_path("simple.doc"), "rb") as f:
+        doc_bytes = f.read()
+
+    partition_doc(file=io.BytesIO(doc_bytes))
+
+    assert written_bytes == [doc_bytes]
+
+
+@pytest.mark.parametrize("use_open_file", [True, False])
+def test_copy_file_contents_copies_the_remaining_bytes_of_the_source(
+    tmp_path: pathlib.Path, use_open_file: bool
+):
+    source_path = tmp_path / "source.doc"
+    source_path.write_bytes(b"0123456789" * 1000)
+    target_path = tmp_path / "target.doc"
+
+    with open(source_path, "rb") as src, open(target_path, "wb") as dst:
+        src = src if use_open_file else io.BytesIO(src.read())
+        src.seek(10)
+        _copy_file_contents(src, dst)
+        position = src.tell()
+
+    assert target_path.read_bytes() == b"0123456789" * 999
+    assert position == 10000
+
+
+def test_partition_doc_partitions_a_docx_file_mislabeled_as_doc_without_conversion(
+    request: FixtureRequest, tmp_path: pathlib.Path
+):
+    convert_doc_to_docx_ = function_mock(request, "unstructured.partition.doc._convert_doc_to_docx")
+    doc_file_path = str(tmp_path / "simple.doc")
+    with open(example_doc_path("simple.docx"), "rb") as src, open(doc_file_path, "wb") as dst:
+        dst.write(src.read())
+
+    elements = partition_doc(doc_file_path)
+
+    convert_doc_to_docx_.assert_not_called()
+    assert elements == partition_docx(example_doc_path("simple.docx"))
+    assert all(e.metadata.filename == "simple.doc" for e in elements)
+    assert all(e.metadata.filetype == "application/msword" for e in elements)
+
+
+def test_partition_doc_partitions_a_docx_file_like_object_without_conversion(
+    request: FixtureRequest,
+):
+    convert_doc_to_docx_ = function_mock(request, "unstructured.partition.doc._convert_doc_to_docx")
+
+    with open(example_doc_path("simple.docx"), "rb") as f:
+        elements = partition_doc(file=f)
+
+    convert_doc_to_docx_.assert_not_called()
+    assert elements == partition_docx(example_doc_path("simple.docx"))
+    assert all(e.metadata.filename is None for e in elements)
+
+
+@pytest.mark.parametrize("use_file", [False, True])
+def test_partition_doc_converts_a_zip_archive_that_is_not_a_docx_package(
+    request: FixtureRequest, monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path, use_file: bool
+):
+    monkeypatch.setenv("UNSTRUCTURED_SOFFICE_DAEMON", "0")
+    convert_office_doc_ = function_mock(
+        request,
+        "unstructured.partition.doc.convert_office_doc",
+        side_effect=fake_convert_office_doc,
+    )
+    function_mock(
+        request,
+        "unstructured.partition.docx.partition_docx",
+        side_effect=fake_partition_docx,
+    )
+    doc_file_path = str(tmp_path / "simple.doc")
+    shutil.copyfile(example_doc_path("simple.odt"), doc_file_path)
+
+    if use_file:
+        with open(doc_file_path, "rb") as f:
+            elements = partition_doc(file=f)
+    else:
+        elements = partition_doc(doc_file_path)
+
+    convert_office_doc_.assert_called_once()
+    assert elements == [Text("converted")]
+
+
+def test_partition_doc_converts_a_non_seekable_file_like_object(
+    request: FixtureRequest, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("UNSTRUCTURED_SOFFICE_DAEMON", "0")
+    function_mock(
+        request,
+        "unstructured.partition.doc.convert_office_doc",
+        side_effect=fake_convert_office_doc,
+    )
+    function_mock(
+        request,
+        "unstructured.partition.docx.partition_docx",
+        side_effect=fake_partition_docx,
+    )
+    with open(example_doc_path("simple.doc"), "rb") as f:
+        file = NonSeekableStream(f.read())
+
+    elements = partition_doc(file=file)
+
+    assert elements == [Text("converted")]
+
+
+def test_partition_doc_partitions_a_non_seekable_docx_file_like_object_without_conversion(
+    request: FixtureRequest,
+):
+    convert_doc_to_docx_ = function_mock(request, "unstructured.partition.doc._convert_doc_to_docx")
+    with open(example_doc_path("simple.docx"), "rb") as f:
+        file = NonSeekableStream(f.read())
+
+    elements = partition_doc(file=file)
+
+    convert_doc_to_docx_.assert_not_called()
+    assert elements == partition_docx(example_doc_path("simple.docx"))
+    assert all(e.metadata.filename is None for e in elements)
+
+
+# -- DOC -> DOCX conversion ----------------------------------------------------------------------
+
+
+def test_partition_doc_converts_using_the_soffice_daemon_when_available(request: FixtureRequest):
+    daemon_ = instance_mock(request, _SofficeDaemon)
+    method_mock(request, _SofficeDaemon, "get", autospec=False, return_value=daemon_)
+    convert_office_doc_ = function_mock(request, "unstructured.partition.doc.convert_office_doc")
+    function_mock(request, "unstructured.partition.docx.partition_docx", return_value=[])
+    doc_file_path = example_doc_path("simple.doc")
+
+    partition_doc(doc_file_path)
+
+    daemon_.convert.assert_called_once_with(doc_file_path, ANY, "MS Word 2007 XML")
+    assert daemon_.convert.call_args.args[1].endswith("simple.docx")
+    convert_office_doc_.assert_not_called()
+
+
+def test_partition_doc_falls_back_to_soffice_cli_when_the_daemon_fails(request: FixtureRequest):
+    daemon_ = instance_mock(request, _SofficeDaemon)
+    daemon_.convert.side_effect = RuntimeError("soffice went away")
+    method_mock(request, _SofficeDaemon, "get", autospec=False, return_value=daemon_)
+    convert_office_doc_ = function_mock(request, "unstructured.partition.doc.convert_office_doc")
+    function_mock(request, "unstructured.partition.docx.partition_docx", return_value=[])
+    doc_file_path = example_doc_path("simple.doc")
+
+    partition_doc(doc_file_path)
+
+    convert_office_doc_.assert_called_once_with(
+        doc_file_path,
+        ANY,
+        target_format="docx",
+        target_filter="MS Word 2007 XML",
+        soffice_extra_args=None,
+    )
+
+
+@pytest.mark.parametrize(
+    ("env_value", "libre_office_filter"), [("0", "MS Word 2007 XML"), ("1", None)]
+)
+def test_partition_doc_does_not_use_the_soffice_daemon_when_disabled_or_no_filter(
+    request: FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+    env_value: str,
+    libre_office_filter: str | None,
+):
+    monkeypatch.setenv("UNSTRUCTURED_SOFFICE_DAEMON", env_value)
+    get_ = method_mock(request, _SofficeDaemon, "get", autospec=False)
+    convert_office_doc_ = function_mock(request, "unstructured.partition.doc.convert_office_doc")
+    function_mock(request, "unstructured.partition.docx.partition_docx", return_value=[])
+
+    partition_doc(example_doc_path("simple.doc"), libre_office_filter=libre_office_filter)
+
+    get_.assert_not_called()
+    convert_office_doc_.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("uno_exists", "soffice_path"), [(False, "/usr/bin/soffice"), (True, None)]
+)
+def test_soffice_daemon_is_quietly_unavailable_without_uno_or_soffice(
+    request: FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+    capsys: CaptureFixture[str],
+    uno_exists: bool,
+    soffice_path: str | None,
+):
+    monkeypatch.setattr(_SofficeDaemon, "_instance", None)
+    monkeypatch.setattr(_SofficeDaemon, "_unavailable", False)
+    function_mock(request, "unstructured.partition.doc.dependency_exists", return_value=uno_exists)
+    function_mock(request, "unstructured.partition.doc.shutil.which", return_value=soffice_path)
+    start_ = method_mock(request, _SofficeDaemon, "_start", autospec=False)
+
+    with caplog.at_level(logging.DEBUG, logger="unstructured"):
+        daemon = _SofficeDaemon.get()
+
+    assert daemon is None
+    start_.assert_not_called()
+    assert [r.levelno for r in caplog.records] == [logging.DEBUG]
+    assert caplog.records[0].exc_info is None
+    assert capsys.readouterr().err == ""
+
+
+def test_soffice_daemon_inherited_across_fork_is_left_to_the_parent(
+    request: FixtureRequest, monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+):
+    profile_dir = tmp_path / "profile"
+    profile_dir.mkdir()
+    process_, desktop_ = Mock(name="process_"), Mock(name="desktop_")
+    inherited_daemon = _SofficeDaemon(process_, desktop_, str(profile_dir))
+    # -- as though this daemon was started by the parent of this (forked) process --
+    inherited_daemon._pid = os.getpid() + 1
+    monkeypatch.setattr(_SofficeDaemon, "_instance", inherited_daemon)
+    monkeypatch.setattr(_SofficeDaemon, "_unavailable", False)
+    function_mock(request, "unstructured.partition.doc.dependency_exists", return_value=False)
+
+    daemon = _SofficeDaemon.get()
+    inherited_daemon.terminate()
+
+    assert daemon is None
+    process_.poll.assert_not_called()
+    process_.wait.assert_not_called()
+    desktop_.terminate.assert_not_called()
+    assert profile_dir.is_dir()
+
+
+@pytest.mark.parametrize("daemon_env_value", ["0", "1"])
+def test_partition_doc_forwards_soffice_extra_args_to_convert_office_doc(
+    request: FixtureRequest, monkeypatch: pytest.MonkeyPatch, daemon_env_value: str
+):
+    monkeypatch.setenv("UNSTRUCTURED_SOFFICE_DAEMON", daemon_env_value)
+    daemon_ = instance_mock(request, _SofficeDaemon)
+    method_mock(request, _SofficeDaemon, "get", autospec=False, return_value=daemon_)
+    convert_office_doc_ = function_mock(request, "unstructured.partition.doc.convert_office_doc")
+    function_mock(request, "unstructured.partition.docx.partition_docx", return_value=[])
+    soffice_extra_args = ["-env:UserInstallation=file:///tmp/profile"]
+
+    partition_doc(example_doc_path("simple.doc"), soffice_extra_args=soffice_extra_args)
+
+    daemon_.convert.assert_not_called()
+    assert convert_office_doc_.call_args.kwargs["soffice_extra_args"] == soffice_extra_args
+
+
+def test_partition_doc_converts_using_libreoffice_pure_when_selected(
+    request: FixtureRequest, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("UNSTRUCTURED_DOC_BACKEND", "lo-pure")
+    convert_with_libreoffice_pure_ = function_mock(
+        request, "unstructured.partition.doc._convert_with_libreoffice_pure", return_value=True
+    )
+    convert_office_doc_ = function_mock(request, "unstructured.partition.doc.convert_office_doc")
+    function_mock(request, "unstructured.partition.docx.partition_docx", return_value=[])
+    doc_file_path = example_doc_path("simple.doc")
+
+    partition_doc(doc_file_path)
+
+    convert_with_libreoffice_pure_.assert_called_once_with(doc_file_path, ANY, ANY)
+    convert_office_doc_.assert_not_called()
+
+
+def test_partition_doc_falls_back_to_soffice_when_libreoffice_pure_is_not_installed(
+    request: FixtureRequest, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("UNSTRUCTURED_DOC_BACKEND", "lo-pure")
+    monkeypatch.setenv("UNSTRUCTURED_SOFFICE_DAEMON", "0")
+    function_mock(request, "unstructured.partition.doc.shutil.which", return_value=None)
+    convert_office_doc_ = function_mock(request, "unstructured.partition.doc.convert_office_doc")
+    function_mock(request, "unstructured.partition.docx.partition_docx", return_value=[])
+
+    partition_doc(example_doc_path("simple.doc"))
+
+    convert_office_doc_.assert_called_once()
+
+
+def test_partition_doc_reuses_the_cached_conversion_of_the_same_document(
+    request: FixtureRequest, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("UNSTRUCTURED_SOFFICE_DAEMON", "0")
+    convert_office_doc_ = function_mock(
+        request,
+        "unstructured.partition.doc.convert_office_doc",
+        side_effect=fake_convert_office_doc,
+    )
+    partition_docx_ = function_mock(
+        request, "unstructured.partition.docx.partition_docx", side_effect=fake_partition_docx
+    )
+
+    first = partition_doc(example_doc_path("simple.doc"))
+    with open(example_doc_path("simple.doc"), "rb") as f:
+        second = partition_doc(file=f)
+
+    assert convert_office_doc_.call_count == 1
+    assert partition_docx_.call_count == 2
+    assert first == second == [Text("converted")]
+
+
+def test_partition_doc_does_not_reuse_a_conversion_made_by_another_converter_or_soffice_args(
+    request: FixtureRequest, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("UNSTRUCTURED_SOFFICE_DAEMON", "0")
+    monkeypatch.setenv("UNSTRUCTURED_DOC_BACKEND", "lo-pure")
+
+    def fake_convert_with_libreoffice_pure(
+        source_file_path: str, target_dir: str, target_file_path: str
+    ) -> bool:
+        with open(target_file_path, "wb") as f:
+            f.write(b"converted by libreoffice-pure")
+        return True
+
+    function_mock(
+        request,
+        "unstructured.partition.doc._convert_with_libreoffice_pure",
+        side_effect=fake_convert_with_libreoffice_pure,
+    )
+    function_mock(
+        request, "unstructured.partition.doc.shutil.which", return_value="/bin/libreoffice-pure"
+    )
+    convert_office_doc_ = function_mock(
+        request,
+        "unstructured.partition.doc.convert_office_doc",
+        side_effect=fake_convert_office_doc,
+    )
+    function_mock(
+        request, "unstructured.partition.docx.partition_docx", side_effect=fake_partition_docx
+    )
+    doc_file_path = example_doc_path("simple.doc")
+
+    by_libreoffice_pure = partition_doc(doc_file_path)
+    monkeypatch.setenv("UNSTRUCTURED_DOC_BACKEND", "soffice")
+    by_soffice = partition_doc(doc_file_path)
+    partition_doc(doc_file_path, soffice_extra_args=["-env:UserInstallation=file:///tmp/profile"])
+
+    assert by_libreoffice_pure == [Text("converted by libreoffice-pure")]
+    assert by_soffice == [Text("converted")]
+    assert convert_office_doc_.call_count == 2
+
+
+def test_partition_doc_converts_again_after_the_cache_is_cleared(
+    request: FixtureRequest, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("UNSTRUCTURED_SOFFICE_DAEMON", "0")
+    convert_office_doc_ = function_mock(
+        request,
+        "unstructured.partition.doc.convert_office_doc",
+        side_effect=fake_convert_office_doc,
+    )
+    function_mock(
+        request, "unstructured.partition.docx.partition_docx", side_effect=fake_partition_docx
+    )
+
+    partition_doc(example_doc_path("simple.doc"))
+    clear_doc_conversion_cache()
+    partition_doc(example_doc_path("simple.doc"))
+
+    assert convert_office_doc_.call_count == 2
+
+
+def test_partition_doc_does_not_cache_conversions_when_disabled(
+    request: FixtureRequest, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("UNSTRUCTURED_SOFFICE_DAEMON", "0")
+    monkeypatch.setenv("UNSTRUCTURED_DOC_CACHE", "0")
+    convert_office_doc_ = function_mock(
+        request,
+        "unstructured.partition.doc.convert_office_doc",
+        side_effect=fake_convert_office_doc,
+    )
+    function_mock(
+        request, "unstructured.partition.docx.partition_docx", side_effect=fake_partition_docx
+    )
+
+    partition_doc(example_doc_path("simple.doc"))
+    partition_doc(example_doc_path("simple.doc"))
+
+    assert convert_office_doc_.call_count == 2
+
+
+def test_partition_doc_removes_its_temporary_directory(
+    request: FixtureRequest, monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+):
+    monkeypatch.setenv("UNSTRUCTURED_TMPDIR", str(tmp_path))
+    remove_ = method_mock(request, _DeferredDirRemover, "remove")
+    function_mock(request, "unstructured.partition.doc._convert_doc_to_docx")
+    function_mock(request, "unstructured.partition.docx.partition_docx", return_value=[])
+
+    partition_doc(example_doc_path("simple.doc"))
+
+    (target_dir,) = tmp_path.iterdir()
+    remove_.assert_called_once_with(ANY, str(target_dir))
+
+
+def test_partition_doc_releases_its_temporary_directory_before_partitioning_the_docx(
+    request: FixtureRequest, monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+):
+    monkeypatch.setenv("UNSTRUCTURED_TMPDIR", str(tmp_path))
+    monkeypatch.setenv("UNSTRUCTURED_SOFFICE_DAEMON", "0")
+    function_mock(
+        request,
+        "unstructured.partition.doc.convert_office_doc",
+        side_effect=fake_convert_office_doc,
+    )
+    docx_file_paths: list[str] = []
+
+    def record_partitioned_docx(filename: str, **kwargs: Any) -> list[Element]:
+        # -- only the converted .docx file remains when partitioning starts --
+        assert [str(p) for p in tmp_path.iterdir()] == [filename]
+        docx_file_paths.append(filename)
+        return []
+
+    function_mock(
+        request, "unstructured.partition.docx.partition_docx", side_effect=record_partitioned_docx
+    )
+    monkeypatch.setattr(
+        _DeferredDirRemover, "remove", lambda self, path: shutil.rmtree(path, ignore_errors=True)
+    )
+
+    partition_doc(example_doc_path("simple.doc"))
+
+    assert len(docx_file_paths) == 1
+    assert docx_file_paths[0].endswith(".docx")
+    # -- and the .docx file is removed once partitioned --
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_scratch_dir_prefers_the_UNSTRUCTURED_TMPDIR_setting(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+):
+    monkeypatch.setenv("UNSTRUCTURED_TMPDIR", str(tmp_path))
+    assert _scratch_dir() == str(tmp_path)
+
+
+def test_scratch_dir_uses_dev_shm_when_it_is_writable(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("UNSTRUCTURED_TMPDIR", raising=False)
+    monkeypatch.delenv("GLOBAL_WORKING_DIR_ENABLED", raising=False)
+    monkeypatch.setattr(os.path, "isdir", lambda path: True)
+    monkeypatch.setattr(os, "access", lambda path, mode: True)
+    monkeypatch.setattr(shutil, "disk_usage", lambda path: SimpleNamespace(free=2**30))
+
+    assert _scratch_dir() == "/dev/shm"
+
+
+def test_scratch_dir_falls_back_to_the_default_when_dev_shm_is_not_usable(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.delenv("UNSTRUCTURED_TMPDIR", raising=False)
+    monkeypatch.delenv("GLOBAL_WORKING_DIR_ENABLED", raising=False)
+    monkeypatch.setattr(os, "access", lambda path, mode: False)
+
+    assert _scratch_dir() is None
+
+
+@pytest.mark.parametrize("max_pending", [0, 4])
+def test_deferred_dir_remover_removes_the_directory(tmp_path: pathlib.Path, max_pending: int):
+    target_dir = tmp_path / "target"
+    (target_dir / "media").mkdir(parents=True)
+    (target_dir / "media" / "image.png").write_bytes(b"png")
+    remover = _DeferredDirRemover(max_pending=max_pending)
+
+    remover.remove(str(target_dir))
+    remover.remove_pending()
+
+    assert not target_dir.exists()
+
+
+# -- partition_docs() -----------------------------------------------------------------------------
+
+
+def test_partition_docs_converts_the_documents_in_a_single_soffice_run(
+    request: FixtureRequest, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("UNSTRUCTURED_SOFFICE_DAEMON", "0")
+    convert_office_doc_ = function_mock(
+        request,
+        "unstructured.partition.doc.convert_office_doc",
+        side_effect=fake_convert_office_doc,
+    )
+    function_mock(
+        request, "unstructured.partition.docx.partition_docx", side_effect=fake_partition_docx
+    )
+    filenames = [
+        example_doc_path("simple.doc"),
+        example_doc_path("fake.doc"),
+        example_doc_path("duplicate-paragraphs.doc"),
+    ]
+
+    elements = partition_docs(filenames, metadata_filename="test")
+
+    convert_office_doc_.assert_called_once()
+    assert len(convert_office_doc_.call_args.args[0]) == 3
+    assert elements == [[Text("converted")]] * 3
+    assert all(e.metadata.filename == "test" for doc_elements in elements for e in doc_elements)
+
+
+@pytest.mark.parametrize("cache_env_value", ["0", "1"])
+def test_partition_docs_converts_any_number_of_documents_in_one_soffice_run(
+    request: FixtureRequest, monkeypatch: pytest.MonkeyPatch, cache_env_value: str
+):
+    monkeypatch.setenv("UNSTRUCTURED_SOFFICE_DAEMON", "0")
+    monkeypatch.setenv("UNSTRUCTURED_DOC_CACHE", cache_env_value)
+    convert_office_doc_ = function_mock(
+        request,
+        "unstructured.partition.doc.convert_office_doc",
+        side_effect=fake_convert_office_doc,
+    )
+    function_mock(
+        request, "unstructured.partition.docx.partition_docx", side_effect=fake_partition_docx
+    )
+    filenames = [example_doc_path("simple.doc")] * 20
+
+    elements = partition_docs(filenames)
+
+    convert_office_doc_.assert_called_once()
+    assert len(convert_office_doc_.call_args.args[0]) == 20
+    assert elements == [[Text("converted")]] * 20
+
+
+def test_partition_docs_matches_partition_doc_for_each_document(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+):
+    monkeypatch.setenv("UNSTRUCTURED_SOFFICE_DAEMON", "0")
+    monkeypatch.setenv("UNSTRUCTURED_DOC_CACHE", "0")
+    # -- a second document with the same base-name as the first --
+    other_doc_file_path = str(tmp_path / "simple.doc")
+    shutil.copyfile(example_doc_path("duplicate-paragraphs.doc"), other_doc_file_path)
+    filenames = [example_doc_path("simple.doc"), other_doc_file_path]
+
+    elements = partition_docs(filenames)
+
+    assert elements == [partition_doc(filename) for filename in filenames]
+    assert [e.metadata.file_directory for e in elements[1]] == [str(tmp_path)] * len(elements[1])
+
+
+def test_partition_docs_divides_the_documents_among_soffice_runs_when_parallel(
+    request: FixtureRequest, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("UNSTRUCTURED_SOFFICE_DAEMON", "0")
+    monkeypatch.setenv("UNSTRUCTURED_DOC_PARALLEL", "1")
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    profile_pool = _SofficeProfilePool()
+    request.addfinalizer(profile_pool.remove_all)
+    monkeypatch.setattr("unstructured.partition.doc._soffice_profile_pool", profile_pool)
+    convert_office_doc_ = function_mock(
+        request,
+        "unstructured.partition.doc.convert_office_doc",
+        side_effect=fake_concurrent_convert_office_doc(n_concurrent=2),
+    )
+    function_mock(
+        request, "unstructured.partition.docx.partition_docx", side_effect=fake_partition_docx
+    )
+    filenames = [
+        example_doc_path("simple.doc"),
+        example_doc_path("fake.doc"),
+        example_doc_path("duplicate-paragraphs.doc"),
+    ]
+
+    elements = partition_docs(filenames)
+
+    assert sorted(len(c.args[0]) for c in convert_office_doc_.call_args_list) == [1, 2]
+    user_installations = {
+        c.kwargs["soffice_extra_args"][0] for c in convert_office_doc_.call_args_list
+    }
+    assert len(user_installations) == 2
+    assert all(arg.startswith("-env:UserInstallation=file://") for arg in user_installations)
+    assert elements == [[Text("converted")]] * 3
+
+
+@pytest.mark.parametrize("cache_env_value", ["0", "1"])
+def test_partition_docs_uses_one_soffice_run_per_cpu_and_reuses_their_profiles(
+    request: FixtureRequest, monkeypatch: pytest.MonkeyPatch, cache_env_value: str
+):
+    monkeypatch.setenv("UNSTRUCTURED_SOFFICE_DAEMON", "0")
+    monkeypatch.setenv("UNSTRUCTURED_DOC_PARALLEL", "1")
+    monkeypatch.setenv("UNSTRUCTURED_DOC_CACHE", cache_env_value)
+    monkeypatch.setattr(os, "cpu_count", lambda: 12)
+    profile_pool = _SofficeProfilePool()
+    request.addfinalizer(profile_pool.remove_all)
+    monkeypatch.setattr("unstructured.partition.doc._soffice_profile_pool", profile_pool)
+    convert_office_doc_ = function_mock(
+        request,
+        "unstructured.partition.doc.convert_office_doc",
+        side_effect=fake_concurrent_convert_office_doc(n_concurrent=12),
+    )
+    function_mock(
+        request, "unstructured.partition.docx.partition_docx", side_effect=fake_partition_docx
+    )
+    filenames = [example_doc_path("simple.doc")] * 12
+
+    partition_docs(filenames)
+    first_user_installations = {
+        c.kwargs["soffice_extra_args"][0] for c in convert_office_doc_.call_args_list
+    }
+    convert_office_doc_.reset_mock()
+    partition_docs(filenames)
+    second_user_installations = {
+        c.kwargs["soffice_extra_args"][0] for c in convert_office_doc_.call_args_list
+    }
+
+    assert convert_office_doc_.call_count == 12
+    assert len(first_user_installations) == 12
+    assert second_user_installations == first_user_installations
+    for user_installation in first_user_installations:
+        profile_uri = user_installation.removeprefix("-env:UserInstallation=")
+        assert os.path.isdir(profile_uri.removeprefix("file://"))
+
+
+def test_partition_docs_raises_with_a_missing_doc(tmp_path: pathlib.Path):
+    with pytest.raises(ValueError, match="asdf.doc does not exist"):
+        partition_docs([example_doc_path("simple.doc"), str(tmp_path / "asdf.doc")])
+
+
 # -- `include_metadata` arg ----------------------------------------------------------------------
 
 
@@ -135,7 +777,8 @@ def test_partition_doc_from_file_prefers_metadata_filename_when_provided():
 def test_partition_doc_pulls_last_modified_from_filesystem(mocker: MockFixture):
     filesystem_last_modified = "2029-07-05T09:24:28"
     mocker.patch(
-        "unstructured.partition.doc.get_last_modified", return_value=filesystem_last_modified
+        "unstructured.partition.doc.get_last_modified_date_from_stat",
+        return_value=filesystem_last_modified,
     )
 
     elements = partition_doc(example_doc_path("fake.doc"))
@@ -149,7 +792,8 @@ def test_partition_doc_prefers_metadata_last_modified_when_provided(
     filesystem_last_modified = "2029-07-05T09:24:28"
     metadata_last_modified = "2020-07-05T09:24:28"
     mocker.patch(
-        "unstructured.partition.doc.get_last_modified", return_value=filesystem_last_modified
+        "unstructured.partition.doc.get_last_modified_date_from_stat",
+        return_value=filesystem_last_modified,
     )
 
     elements = partition_doc(
@@ -162,9 +806,8 @@ def test_partition_doc_prefers_metadata_last_modified_when_provided(
 # -- language-recognition metadata ---------------------------------------------------------------
 
 
-def test_partition_doc_adds_languages_metadata():
-    elements = partition_doc(example_doc_path("simple.doc"))
-    assert all(e.metadata.languages == ["eng"] for e in elements)
+def test_partition_doc_adds_languages_metadata(simple_doc_elements: list[Element]):
+    assert all(e.metadata.languages == ["eng"] for e in simple_doc_elements)
 
 
 def test_partition_doc_respects_detect_language_per_element_arg():
@@ -190,7 +833,7 @@ def test_partition_doc_respects_detect_language_per_element_arg():
 def test_partition_doc_forwards_strategy_arg_to_partition_docx(
     request: FixtureRequest, kwargs: dict[str, Any], expected_value: str | None
 ):
-    partition_docx_ = function_mock(request, "unstructured.partition.doc.partition_docx")
+    partition_docx_ = function_mock(request, "unstructured.partition.docx.partition_docx")
 
     partition_doc(example_doc_path("simple.doc"), **kwargs)
 
@@ -220,20 +863,20 @@ def test_partition_doc_grabs_emphasized_texts():
     assert elements[2].metadata.emphasized_text_tags is None
 
 
-def test_partition_doc_round_trips_through_json():
+def test_partition_doc_round_trips_through_json(simple_doc_elements: list[Element]):
     """Elements produced can be serialized then deserialized without loss."""
-    assert_round_trips_through_JSON(partition_doc(example_doc_path("simple.doc")))
+    assert_round_trips_through_JSON(simple_doc_elements)
 
 
-def test_partition_doc_chunks_elements_when_chunking_strategy_is_specified():
-    document_path = example_doc_path("simple.doc")
-    elements = partition_doc(document_path)
-    chunks = partition_doc(document_path, chunking_strategy="basic")
+def test_partition_doc_chunks_elements_when_chunking_strategy_is_specified(
+    simple_doc_elements: list[Element],
+):
+    chunks = partition_doc(example_doc_path("simple.doc"), chunking_strategy="basic")
 
     # -- all chunks are chunk element-types --
     assert all(isinstance(c, (CompositeElement, Table, TableChunk)) for c in chunks)
     # -- chunks from partitioning match those produced by chunking elements in separate step --
-    assert chunks == chunk_elements(elements)
+    assert chunks == chunk_elements(simple_doc_elements)
 
 
 def test_partition_doc_assigns_deterministic_and_unique_element_ids():
@@ -251,6 +894,23 @@ def test_partition_doc_assigns_deterministic_and_unique_element_ids():
 # == module-level fixtures =======================================================================
 
 
+@pytest.fixture(autouse=True)
+def _clear_doc_conversion_cache():
+    """Don't let a conversion cached by one test stand in for the conversion in another."""
+    clear_doc_conversion_cache()
+    yield
+    clear_doc_conversion_cache()
+
+
+@pytest.fixture(scope="session")
+def simple_doc_elements() -> list[Element]:
+    """Elements partitioned from "simple.doc", shared because its conversion is slow.
+
+    Tests using this fixture must not change these elements.
+    """
+    return partition_doc(example_doc_path("simple.doc"))
+
+
 @pytest.fixture()
 def expected_elements() -> list[Element]:
     return [
@@ -263,3 +923,49 @@ def expected_elements() -> list[Element]:
         Text("2023"),
         Address("DOYLESTOWN, PA 18901"),
     ]
+
+
+# == module-level helpers ========================================================================
+
+
+def fake_convert_office_doc(input_filename: str | list[str], output_directory: str, **kwargs: Any):
+    """Stand-in for `convert_office_doc()` that writes a placeholder DOCX file for each input."""
+    input_filenames = [input_filename] if isinstance(input_filename, str) else input_filename
+    for filename in input_filenames:
+        base_name, _ = os.path.splitext(os.path.basename(filename))
+        with open(os.path.join(output_directory, f"{base_name}.docx"), "wb") as f:
+            f.write(b"converted")
+
+
+def fake_concurrent_convert_office_doc(n_concurrent: int) -> Callable[..., None]:
+    """Stand-in for `convert_office_doc()` when `n_concurrent` calls to it run at the same time.
+
+    Each call waits until all are running, as they would be converting real documents, then
+    behaves like `fake_convert_office_doc()`.
+    """
+    all_running = threading.Barrier(n_concurrent, timeout=10)
+
+    def convert_office_doc(*args: Any, **kwargs: Any):
+        all_running.wait()
+        fake_convert_office_doc(*args, **kwargs)
+
+    return convert_office_doc
+
+
+def fake_partition_docx(filename: str, **kwargs: Any) -> list[Element]:
+    """Stand-in for `partition_docx()` that "partitions" a placeholder DOCX file."""
+    with open(filename, "rb") as f:
+        return [Text(f.read().decode())]
+
+
+class NonSeekableStream(io.RawIOBase):
+    """File-like object that can only be read from start to end, like a pipe."""
+
+    def __init__(self, data: bytes):
+        self._data = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        return self._data.readinto(buffer)
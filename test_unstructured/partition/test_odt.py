@@ -7,14 +7,9 @@ from typing import Any
 import pytest
 from pytest_mock import MockFixture
 
-from test_unstructured.unit_utils import (
-    FixtureRequest,
-    assert_round_trips_through_JSON,
-    example_doc_path,
-    function_mock,
-)
+from test_unstructured.unit_utils import assert_round_trips_through_JSON, example_doc_path
 from unstructured.chunking.basic import chunk_elements
-from unstructured.documents.elements import CompositeElement, Table, TableChunk, Title
+from unstructured.documents.elements import CompositeElement, Element, Table, TableChunk, Title
 from unstructured.partition.docx import partition_docx
 from unstructured.partition.odt import partition_odt
 from unstructured.partition.utils.constants import UNSTRUCTURED_INCLUDE_DEBUG_METADATA
@@ -173,13 +168,22 @@ def test_partition_odt_respects_detect_language_per_element_arg():
     [({}, None), ({"strategy": None}, None), ({"strategy": "hi_res"}, "hi_res")],
 )
 def test_partition_odt_forwards_strategy_arg_to_partition_docx(
-    request: FixtureRequest, kwargs: dict[str, Any], expected_value: str | None
+    monkeypatch: pytest.MonkeyPatch, kwargs: dict[str, Any], expected_value: str | None
 ):
-    partition_docx_ = function_mock(request, "unstructured.partition.odt.partition_docx")
+    calls: list[dict[str, Any]] = []
+
+    def fake_partition_docx(**call_kwargs: Any) -> list[Element]:
+        calls.append(call_kwargs)
+        return []
+
+    monkeypatch.setattr(
+        "unstructured.partition.odt.partition_docx", fake_partition_docx, raising=True
+    )
 
     partition_odt(example_doc_path("simple.odt"), **kwargs)
 
-    call_kwargs = partition_docx_.call_args.kwargs
+    assert len(calls) == 1
+    call_kwargs = calls[0]
     # -- `strategy` keyword-argument appeared in the call --
     assert "strategy" in call_kwargs
     # -- `strategy` argument was passed with the expected value --
@@ -1 +1 @@
-__version__ = "0.14.10-dev0"  # pragma: no cover
+__version__ = "0.14.10-dev13"  # pragma: no cover
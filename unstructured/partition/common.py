@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import contextlib
 import numbers
 import os
+import stat
 import subprocess
 from datetime import datetime
 from io import BufferedReader, BytesIO, TextIOWrapper
 from tempfile import SpooledTemporaryFile
 from time import sleep
-from typing import IO, TYPE_CHECKING, Any, Optional, TypeVar, cast
+from typing import IO, TYPE_CHECKING, Any, Optional, Sequence, TypeVar, cast
 
 import emoji
 import psutil
@@ -89,10 +91,24 @@ def get_last_modified_date(filename: str) -> Optional[str]:
     Otherwise returns date and time in ISO 8601 string format (YYYY-MM-DDTHH:MM:SS) like
     "2024-03-05T17:02:53".
     """
-    if not os.path.isfile(filename):
+    try:
+        file_stat = os.stat(filename)
+    except (OSError, ValueError):
+        return None
+
+    return get_last_modified_date_from_stat(file_stat)
+
+
+def get_last_modified_date_from_stat(file_stat: os.stat_result) -> Optional[str]:
+    """Modification time from `file_stat`, the result of `os.stat()` on a path.
+
+    Returns `None` when `file_stat` is not for a regular file, like a directory. Useful when the
+    caller needs the stat result for other purposes too, saving a second `stat()` call.
+    """
+    if not stat.S_ISREG(file_stat.st_mode):
         return None
 
-    modify_date = datetime.fromtimestamp(os.path.getmtime(filename))
+    modify_date = datetime.fromtimestamp(file_stat.st_mtime)
     return modify_date.strftime("%Y-%m-%dT%H:%M:%S%z")
 
 
@@ -367,29 +383,52 @@ def remove_element_metadata(layout_elements) -> list[Element]:
     return elements
 
 
+# -- pids of `soffice` processes kept running for the life of this process, each with a
+# -- user-profile of its own, like the DOC conversion daemon. They don't stand in the way of a
+# -- conversion and never finish, so `convert_office_doc()` must not wait on them.
+_resident_soffice_pids: set[int] = set()
+
+
 def _is_soffice_running():
+    resident_pids = _resident_soffice_process_tree_pids()
     for proc in psutil.process_iter():
         try:
-            if "soffice" in proc.name().lower():
+            if proc.pid not in resident_pids and "soffice" in proc.name().lower():
                 return True
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             pass
     return False
 
 
+def _resident_soffice_process_tree_pids() -> set[int]:
+    """Pids of the resident `soffice` processes and of the processes they started.
+
+    The `soffice` launcher runs the actual office process (e.g. "soffice.bin") as a child process.
+    """
+    pids: set[int] = set()
+    for pid in list(_resident_soffice_pids):
+        pids.add(pid)
+        with contextlib.suppress(psutil.Error):
+            pids.update(child.pid for child in psutil.Process(pid).children(recursive=True))
+    return pids
+
+
 def convert_office_doc(
-    input_filename: str,
+    input_filename: str | Sequence[str],
     output_directory: str,
     target_format: str = "docx",
     target_filter: Optional[str] = None,
     wait_for_soffice_ready_time_out: int = 10,
+    soffice_extra_args: Optional[Sequence[str]] = None,
 ):
     """Converts a .doc file to a .docx file using the libreoffice CLI.
 
     Parameters
     ----------
-    input_filename: str
-        The name of the .doc file to convert to .docx
+    input_filename: str | Sequence[str]
+        The name of the .doc file to convert to .docx. A sequence of names converts each of those
+        files in a single run of soffice; their base-names should be distinct because each output
+        file takes the base-name of its input file.
     output_directory: str
         The output directory for the convert .docx file
     target_format: str
@@ -399,6 +438,9 @@ def convert_office_doc(
         for details.
     wait_for_soffice_ready_time_out: int
         The max wait time in seconds for soffice to become available to run
+    soffice_extra_args: Sequence[str]
+        Additional command-line arguments for soffice, for example
+        `-env:UserInstallation=file:///tmp/profile` to run with a separate user-profile.
 
     References
     ----------
@@ -412,14 +454,21 @@ def convert_office_doc(
     # users who do not have LibreOffice installed
     # ref: https://stackoverflow.com/questions/38468442/
     #       multiple-doc-to-docx-file-conversion-using-python
+    input_filenames = [input_filename] if isinstance(input_filename, str) else input_filename
     command = [
         "soffice",
         "--headless",
+        # -- skip start-up work that has no bearing on a one-off conversion --
+        "--norestore",
+        "--nolockcheck",
+        "--nodefault",
+        "--nofirststartwizard",
+        *(soffice_extra_args or ()),
         "--convert-to",
         target_format,
         "--outdir",
         output_directory,
-        input_filename,
+        *input_filenames,
     ]
     try:
         # only one soffice process can be ran
@@ -1,18 +1,47 @@
 from __future__ import annotations
 
+import atexit
+import concurrent.futures
+import contextlib
+import hashlib
+import io
+import math
 import os
+import pathlib
+import shutil
+import socket
+import stat
+import subprocess
+import sys
 import tempfile
-from typing import IO, Any, Optional
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from typing import IO, Any, ClassVar, Iterator, Optional, Tuple
 
 from unstructured.chunking import add_chunking_strategy
 from unstructured.documents.elements import Element, process_metadata
 from unstructured.file_utils.filetype import FileType, add_metadata_with_filetype
+from unstructured.logger import logger
 from unstructured.partition.common import (
+    _resident_soffice_pids,
     convert_office_doc,
-    exactly_one,
     get_last_modified,
+    get_last_modified_date,
+    get_last_modified_date_from_stat,
 )
-from unstructured.partition.docx import partition_docx
+from unstructured.partition.utils.config import env_config
+from unstructured.utils import dependency_exists
+
+# -- `os.sendfile()` can copy file-to-file only on Linux, other platforms require a socket target --
+_USE_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+_COPY_BUFSIZE = 1024 * 1024
+_ZIP_SIGNATURE = b"PK\x03\x04"
+# -- `/dev/shm` can be small (64MB by default in a Docker container), use it only with room to
+# -- spare.
+_SHM_DIR = "/dev/shm"
+_SHM_MIN_FREE_BYTES = 256 * 1024 * 1024
 
 
 @process_metadata()
@@ -30,6 +59,7 @@ def partition_doc(
     date_from_file_object: bool = False,
     starting_page_number: int = 1,
     strategy: Optional[str] = None,
+    soffice_extra_args: Optional[list[str]] = None,
     **kwargs: Any,
 ) -> list[Element]:
     """Partitions Microsoft Word Documents in .doc format into its document elements.
@@ -60,56 +90,107 @@ def partition_doc(
         Indicates what page number should be assigned to the first page in the document.
         This information will be reflected in elements' metadata and can be be especially
         useful when partitioning a document that is part of a larger document.
+    soffice_extra_args
+        Additional command-line arguments for `soffice` when it is run to convert the document,
+        for example `["-env:UserInstallation=file:///tmp/profile"]` to use a separate
+        user-profile. When provided, the document is always converted by running the `soffice`
+        command-line program rather than by the long-running `soffice` daemon.
     """
-    exactly_one(filename=filename, file=file)
+    # -- exactly one of `filename` and `file` must be provided (an empty `filename` counts as not
+    # -- provided). Validate file-path when provided so we can provide a more meaningful error.
+    # -- The same `stat()` call provides the last-modified date.
+    if (not filename) == (file is None):
+        raise ValueError("Exactly one of filename and file must be specified.")
 
-    last_modified = get_last_modified(filename, file, date_from_file_object)
+    if filename:
+        try:
+            file_stat = os.stat(filename)
+        except FileNotFoundError:
+            raise ValueError(f"The file {filename} does not exist.")
+        last_modified = get_last_modified_date_from_stat(file_stat)
+    else:
+        last_modified = get_last_modified(None, file, date_from_file_object)
 
-    # -- validate file-path when provided so we can provide a more meaningful error --
-    if filename is not None and not os.path.exists(filename):
-        raise ValueError(f"The file {filename} does not exist.")
+    # -- importing the DOCX partitioner is expensive (it loads `lxml`, `python-docx` and the NLP
+    # -- dependencies), so defer that cost until a DOC document is actually partitioned.
+    from unstructured.partition.docx import partition_docx
+
+    # -- a ".doc" file is sometimes actually a DOCX (OOXML) package. No conversion is needed for
+    # -- those, partition it directly. A stream that can't seek (e.g. a pipe) can't be sniffed
+    # -- without consuming it nor partitioned as DOCX, its copy on disk is checked further on.
+    sniff_in_place = file is None or _is_seekable(file)
+    if sniff_in_place and _is_docx_package(filename, file):
+        return partition_docx(
+            filename=filename,
+            file=file,
+            detect_language_per_element=detect_language_per_element,
+            include_page_breaks=include_page_breaks,
+            languages=languages,
+            metadata_filename=metadata_filename,
+            metadata_last_modified=metadata_last_modified or last_modified,
+            starting_page_number=starting_page_number,
+            strategy=strategy,
+        )
 
     # -- `convert_office_doc` uses a command-line program that ships with LibreOffice to convert
     # -- from DOC -> DOCX. So both the source and the target need to be file-system files. Put
-    # -- transient files in a temporary directory that is automatically removed so they don't
-    # -- pile up.
-    with tempfile.TemporaryDirectory() as target_dir:
-        source_file_path = f"{target_dir}/document.doc" if file is not None else filename
-        assert source_file_path is not None
-
+    # -- transient files in a temporary directory that is removed so they don't pile up. Removal
+    # -- happens on a background thread so the caller doesn't wait on it.
+    scratch_dir = _scratch_dir()
+    target_dir = tempfile.mkdtemp(dir=scratch_dir)
+    try:
         # -- when source is a file-like object, write it to the filesystem so the command-line
         # -- process can access it (CLI executes in different memory-space).
         if file is not None:
+            source_file_path = f"{target_dir}/document.doc"
+            base_name = "document"
             with open(source_file_path, "wb") as f:
-                f.write(file.read())
+                _copy_file_contents(file, f)
+            is_docx = not sniff_in_place and _is_docx_package(source_file_path, None)
+        else:
+            assert filename is not None
+            source_file_path = filename
+            base_name = pathlib.PurePath(filename).stem
+            is_docx = False
 
-        # -- convert the .doc file to .docx. The resulting file takes the same base-name as the
-        # -- source file and is written to `target_dir`.
-        convert_office_doc(
-            source_file_path,
-            target_dir,
-            target_format="docx",
-            target_filter=libre_office_filter,
-        )
+        if is_docx:
+            # -- the copy of the stream is itself the DOCX document to partition --
+            target_file_path = source_file_path
+        else:
+            # -- compute the path of the resulting .docx document --
+            target_file_path = os.path.join(target_dir, f"{base_name}.docx")
 
-        # -- compute the path of the resulting .docx document --
-        _, filename_no_path = os.path.split(os.path.abspath(source_file_path))
-        base_filename, _ = os.path.splitext(filename_no_path)
-        target_file_path = os.path.join(target_dir, f"{base_filename}.docx")
+            # -- convert the .doc file to .docx. The resulting file takes the same base-name as
+            # -- the source file and is written to `target_dir`.
+            _convert_doc_to_docx(
+                source_file_path,
+                target_dir,
+                target_file_path,
+                libre_office_filter,
+                soffice_extra_args,
+            )
 
-        # -- and partition it. Note that `kwargs` is not passed which is a sketchy way to partially
-        # -- disable post-partitioning processing (what the decorators do) so for example the
-        # -- resulting elements are not double-chunked.
-        elements = partition_docx(
-            filename=target_file_path,
-            detect_language_per_element=detect_language_per_element,
-            include_page_breaks=include_page_breaks,
-            languages=languages,
-            metadata_filename=metadata_filename,
-            metadata_last_modified=metadata_last_modified or last_modified,
-            starting_page_number=starting_page_number,
-            strategy=strategy,
-        )
+        # -- move the .docx file out of `target_dir` so that directory, with the source copy and
+        # -- anything else LibreOffice left there, can be released while the .docx is partitioned.
+        # -- When conversion failed there is no .docx and `partition_docx()` reports it missing.
+        docx_file_path = target_file_path
+        if os.path.isfile(target_file_path):
+            fd, docx_file_path = tempfile.mkstemp(suffix=".docx", dir=scratch_dir)
+            os.close(fd)
+            os.replace(target_file_path, docx_file_path)
+    finally:
+        _deferred_dir_remover.remove(target_dir)
+
+    elements = _partition_converted_docx(
+        docx_file_path,
+        detect_language_per_element=detect_language_per_element,
+        include_page_breaks=include_page_breaks,
+        languages=languages,
+        metadata_filename=metadata_filename,
+        metadata_last_modified=metadata_last_modified or last_modified,
+        starting_page_number=starting_page_number,
+        strategy=strategy,
+    )
 
     # -- Remove temporary document.docx path from metadata when necessary. Note `metadata_filename`
     # -- defaults to `None` but that's better than a meaningless temporary filename.
@@ -118,3 +199,754 @@ def partition_doc(
             element.metadata.filename = metadata_filename
 
     return elements
+
+
+def _partition_converted_docx(docx_file_path: str, **kwargs: Any) -> list[Element]:
+    """Partition the DOCX file at `docx_file_path` converted from a DOC file, then delete it.
+
+    `kwargs` are passed to `partition_docx()`. Note that the caller's own `kwargs` are not among
+    them, which is a sketchy way to partially disable post-partitioning processing (what the
+    decorators do) so for example the resulting elements are not double-chunked.
+    """
+    from unstructured.partition.docx import partition_docx
+
+    try:
+        return partition_docx(filename=docx_file_path, **kwargs)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(docx_file_path)
+
+
+def partition_docs(filenames: list[str], **kwargs: Any) -> list[list[Element]]:
+    """Partitions each of several Microsoft Word Documents in .doc format.
+
+    Produces the same result as calling `partition_doc()` for each file, but the `soffice` CLI
+    converts all the documents to DOCX in one run, so LibreOffice start-up cost is paid once
+    rather than once per document.
+
+    Parameters
+    ----------
+    filenames
+        Paths of the .doc files to partition.
+    kwargs
+        Any keyword argument accepted by `partition_doc()` other than `filename` and `file`. It
+        applies to every document.
+
+    Returns a list of elements for each file in `filenames`, in the same order.
+    """
+    for filename in filenames:
+        if not os.path.exists(filename):
+            raise ValueError(f"The file {filename} does not exist.")
+
+    libre_office_filter = kwargs.get("libre_office_filter", "MS Word 2007 XML")
+    soffice_extra_args = kwargs.get("soffice_extra_args")
+
+    # -- `libreoffice-pure` and the `soffice` daemon have no start-up cost per document to amortize
+    if _doc_converter_name(libre_office_filter, soffice_extra_args) != "soffice":
+        return [partition_doc(filename=filename, **kwargs) for filename in filenames]
+
+    with tempfile.TemporaryDirectory(dir=_scratch_dir()) as target_dir:
+        # -- `soffice` names each output file after its input file, so copy each source under a
+        # -- distinct name in case two of them have the same base-name. Mislabeled DOCX files are
+        # -- not converted.
+        docx_file_paths: dict[int, str] = {}
+        for i, filename in enumerate(filenames):
+            if _is_docx_package(filename, None):
+                continue
+            shutil.copyfile(filename, os.path.join(target_dir, f"{i}.doc"))
+            docx_file_paths[i] = os.path.join(target_dir, f"{i}.docx")
+
+        source_file_paths = [os.path.join(target_dir, f"{i}.doc") for i in docx_file_paths]
+        if env_config.UNSTRUCTURED_DOC_PARALLEL and len(source_file_paths) > 1:
+            _convert_docs_in_parallel(
+                source_file_paths, target_dir, libre_office_filter, soffice_extra_args
+            )
+        elif source_file_paths:
+            convert_office_doc(
+                source_file_paths,
+                target_dir,
+                target_format="docx",
+                target_filter=libre_office_filter,
+                soffice_extra_args=soffice_extra_args,
+            )
+
+        return [
+            (
+                _partition_doc_converted_to_docx(docx_file_paths[i], filename=filename, **kwargs)
+                if i in docx_file_paths
+                else partition_doc(filename=filename, **kwargs)
+            )
+            for i, filename in enumerate(filenames)
+        ]
+
+
+@process_metadata()
+@add_metadata_with_filetype(FileType.DOC)
+@add_chunking_strategy
+def _partition_doc_converted_to_docx(
+    docx_file_path: str,
+    filename: str,
+    include_page_breaks: bool = True,
+    metadata_filename: Optional[str] = None,
+    metadata_last_modified: Optional[str] = None,
+    languages: Optional[list[str]] = ["auto"],
+    detect_language_per_element: bool = False,
+    starting_page_number: int = 1,
+    strategy: Optional[str] = None,
+    **kwargs: Any,
+) -> list[Element]:
+    """Partition DOC file at `filename` that was already converted to the DOCX at `docx_file_path`.
+
+    The counterpart of `partition_doc()` for `partition_docs()`, decorated the same way so the
+    elements are post-processed as `partition_doc()` would. The DOCX file is deleted afterward.
+    """
+    return _partition_converted_docx(
+        docx_file_path,
+        detect_language_per_element=detect_language_per_element,
+        include_page_breaks=include_page_breaks,
+        languages=languages,
+        metadata_filename=metadata_filename,
+        metadata_last_modified=metadata_last_modified or get_last_modified_date(filename),
+        starting_page_number=starting_page_number,
+        strategy=strategy,
+    )
+
+
+def _convert_docs_in_parallel(
+    source_file_paths: list[str],
+    target_dir: str,
+    libre_office_filter: Optional[str],
+    soffice_extra_args: Optional[list[str]],
+) -> None:
+    """Convert DOC files to DOCX in `target_dir` by dividing them among several `soffice` runs.
+
+    Each `soffice` process does its conversion work independently, so one per CPU converts the
+    documents in about the time it takes to convert its share. The worker threads only wait on
+    their `soffice` process.
+    """
+    n_workers = min(os.cpu_count() or 1, len(source_file_paths))
+    chunk_size = math.ceil(len(source_file_paths) / n_workers)
+    chunks = [
+        source_file_paths[i : i + chunk_size] for i in range(0, len(source_file_paths), chunk_size)
+    ]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        futures = [
+            executor.submit(
+                _convert_docs_with_own_profile,
+                chunk,
+                target_dir,
+                libre_office_filter,
+                soffice_extra_args,
+            )
+            for chunk in chunks
+        ]
+        for future in futures:
+            future.result()
+
+
+def _convert_docs_with_own_profile(
+    source_file_paths: list[str],
+    target_dir: str,
+    libre_office_filter: Optional[str],
+    soffice_extra_args: Optional[list[str]],
+) -> None:
+    """Convert DOC files using a `soffice` process with a user-profile of its own.
+
+    `soffice` processes sharing a user-profile hand their work to whichever one started first, so
+    each concurrent process needs its own profile.
+    """
+    with _soffice_profile_pool.profile_dir() as profile_dir:
+        convert_office_doc(
+            source_file_paths,
+            target_dir,
+            target_format="docx",
+            target_filter=libre_office_filter,
+            soffice_extra_args=[
+                f"-env:UserInstallation={pathlib.Path(profile_dir).as_uri()}",
+                *(soffice_extra_args or ()),
+            ],
+        )
+
+
+class _SofficeProfilePool:
+    """User-profile directories for concurrent `soffice` processes, kept for the process lifetime.
+
+    Initializing a new user-profile is a large part of `soffice` start-up, so a profile is lent to
+    one `soffice` process at a time and reused by later ones. The pool grows to as many profiles
+    as there have been concurrent `soffice` processes. They are removed when the interpreter exits.
+    """
+
+    def __init__(self):
+        self._profile_dirs: list[str] = []
+        self._idle_profile_dirs: list[str] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        atexit.register(self.remove_all)
+
+    @contextlib.contextmanager
+    def profile_dir(self) -> Iterator[str]:
+        """Path of a user-profile directory no other `soffice` process is using meanwhile."""
+        with self._lock:
+            if self._pid != os.getpid():
+                # -- inherited across `fork()`, the parent's profiles may be in use by the parent --
+                self._profile_dirs, self._idle_profile_dirs = [], []
+                self._pid = os.getpid()
+            if self._idle_profile_dirs:
+                profile_dir = self._idle_profile_dirs.pop()
+            else:
+                profile_dir = tempfile.mkdtemp(prefix="soffice-profile-")
+                self._profile_dirs.append(profile_dir)
+
+        try:
+            yield profile_dir
+        finally:
+            with self._lock:
+                if profile_dir in self._profile_dirs:
+                    self._idle_profile_dirs.append(profile_dir)
+
+    def remove_all(self) -> None:
+        """Remove the profile directories this process created."""
+        with self._lock:
+            if self._pid != os.getpid():
+                return
+            for profile_dir in self._profile_dirs:
+                shutil.rmtree(profile_dir, ignore_errors=True)
+            self._profile_dirs, self._idle_profile_dirs = [], []
+
+
+_soffice_profile_pool = _SofficeProfilePool()
+
+
+def _is_docx_package(filename: Optional[str], file: Optional[IO[bytes]]) -> bool:
+    """True when the source document is a DOCX (OOXML) package rather than a DOC file.
+
+    A genuine DOC file is an OLE compound file (starting with b"\xd0\xcf\x11\xe0") instead. Other
+    ZIP-based formats, like ODT, are not DOCX and still need conversion. When `file` is provided it
+    must be seekable and its position is restored after inspecting it.
+    """
+    if file is not None:
+        # -- only a ZIP archive needs a closer look, peek at the header when `file` is buffered --
+        peek = getattr(file, "peek", None)
+        header = peek(4)[:4] if peek is not None else b""
+        position = file.tell()
+        try:
+            if len(header) < 4:
+                header = file.read(4)
+            return header == _ZIP_SIGNATURE and _has_docx_parts(file)
+        finally:
+            file.seek(position)
+
+    assert filename is not None
+    with open(filename, "rb") as f:
+        return f.read(4) == _ZIP_SIGNATURE and _has_docx_parts(f)
+
+
+def _has_docx_parts(file: IO[bytes]) -> bool:
+    """True when ZIP archive `file` contains the parts every DOCX package has."""
+    try:
+        with zipfile.ZipFile(file) as zip_file:
+            names = set(zip_file.namelist())
+    except zipfile.BadZipFile:
+        return False
+
+    return {"[Content_Types].xml", "word/document.xml"} <= names
+
+
+def _is_seekable(file: IO[bytes]) -> bool:
+    """True when `file` supports random access, unlike a pipe or socket stream for example."""
+    # -- in Python <3.11 `SpooledTemporaryFile` has no `.seekable()` method but can seek --
+    seekable = getattr(file, "seekable", None)
+    return seekable is None or seekable()
+
+
+def _scratch_dir() -> Optional[str]:
+    """Directory in which to create temporary directories for DOC -> DOCX conversion.
+
+    This is `UNSTRUCTURED_TMPDIR` when that is set. Otherwise, when it is writable and has room to
+    spare, it is the memory-backed `/dev/shm` so neither the source nor the converted document is
+    written to disk. `None` means the default temporary directory.
+    """
+    if tmpdir := env_config.UNSTRUCTURED_TMPDIR:
+        return tmpdir
+
+    # -- a working directory configured for this process takes precedence over `/dev/shm` --
+    if env_config.GLOBAL_WORKING_DIR_ENABLED:
+        return None
+
+    if (
+        os.path.isdir(_SHM_DIR)
+        and os.access(_SHM_DIR, os.W_OK)
+        and shutil.disk_usage(_SHM_DIR).free >= _SHM_MIN_FREE_BYTES
+    ):
+        return _SHM_DIR
+
+    return None
+
+
+def _copy_file_contents(src: IO[bytes], dst: IO[bytes]) -> None:
+    """Copy the remaining bytes of `src` to `dst` without reading the whole document into memory.
+
+    When `src` is a regular file on disk (as returned by `open()`) the copy is done in-kernel with
+    `os.sendfile()`, otherwise it is done in bounded-size chunks.
+    """
+    if _USE_SENDFILE and isinstance(src, (io.BufferedReader, io.FileIO)):
+        try:
+            src_fd = src.fileno()
+            is_regular_file = stat.S_ISREG(os.fstat(src_fd).st_mode)
+        except OSError:
+            # -- includes `io.UnsupportedOperation`, e.g. a `BufferedReader` wrapping a `BytesIO` --
+            is_regular_file = False
+
+        if is_regular_file:
+            offset = start = src.tell()
+            size = os.fstat(src_fd).st_size
+            dst.flush()
+            try:
+                while offset < size:
+                    sent = os.sendfile(dst.fileno(), src_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                # -- some filesystems don't support `sendfile()`, copy the usual way when nothing
+                # -- has been copied yet.
+                if offset != start:
+                    raise
+            else:
+                # -- leave `src` positioned as though it had been read, like `.read()` would --
+                src.seek(offset)
+                return
+
+    shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+
+
+def clear_doc_conversion_cache() -> None:
+    """Discard the DOCX documents `partition_doc()` has cached from earlier conversions."""
+    _converted_docx_cache.clear()
+
+
+def _convert_doc_to_docx(
+    source_file_path: str,
+    target_dir: str,
+    target_file_path: str,
+    libre_office_filter: Optional[str],
+    soffice_extra_args: Optional[list[str]],
+) -> None:
+    """Convert the DOC file at `source_file_path` to a DOCX file at `target_file_path`.
+
+    The DOCX produced for the last few distinct source documents is cached for the life of the
+    process so partitioning the same document again doesn't repeat the conversion. Set
+    `UNSTRUCTURED_DOC_CACHE=0` to disable this cache.
+    """
+    if not env_config.UNSTRUCTURED_DOC_CACHE:
+        _run_doc_to_docx_converter(
+            source_file_path, target_dir, target_file_path, libre_office_filter, soffice_extra_args
+        )
+        return
+
+    cache_key = _ConvertedDocxCache.key(source_file_path, libre_office_filter, soffice_extra_args)
+    if _converted_docx_cache.load(cache_key, target_file_path):
+        return
+
+    _run_doc_to_docx_converter(
+        source_file_path, target_dir, target_file_path, libre_office_filter, soffice_extra_args
+    )
+    _converted_docx_cache.store(cache_key, target_file_path)
+
+
+def _run_doc_to_docx_converter(
+    source_file_path: str,
+    target_dir: str,
+    target_file_path: str,
+    libre_office_filter: Optional[str],
+    soffice_extra_args: Optional[list[str]],
+) -> None:
+    """Run the configured converter to produce a DOCX file at `target_file_path`.
+
+    When `UNSTRUCTURED_DOC_BACKEND` is "lo-pure" and the `libreoffice-pure` program is installed,
+    it does the conversion without LibreOffice at all. Otherwise the conversion is brokered to the
+    long-running `soffice` daemon when one is available, which avoids paying LibreOffice start-up
+    cost on every call. Failing those, this falls back to running the `soffice` command-line
+    program once for this file.
+    """
+    if env_config.UNSTRUCTURED_DOC_BACKEND == "lo-pure" and _convert_with_libreoffice_pure(
+        source_file_path, target_dir, target_file_path
+    ):
+        return
+
+    daemon = (
+        _SofficeDaemon.get()
+        if _uses_soffice_daemon(libre_office_filter, soffice_extra_args)
+        else None
+    )
+    if daemon is not None:
+        assert libre_office_filter is not None  # -- assured by `_uses_soffice_daemon()` --
+        try:
+            daemon.convert(source_file_path, target_file_path, libre_office_filter)
+            return
+        except Exception:
+            logger.warning(
+                "soffice daemon failed to convert %s, falling back to soffice CLI",
+                source_file_path,
+                exc_info=True,
+            )
+
+    convert_office_doc(
+        source_file_path,
+        target_dir,
+        target_format="docx",
+        target_filter=libre_office_filter,
+        soffice_extra_args=soffice_extra_args,
+    )
+
+
+def _uses_soffice_daemon(
+    libre_office_filter: Optional[str], soffice_extra_args: Optional[list[str]]
+) -> bool:
+    """True when DOC conversion with these options is brokered to the `soffice` daemon."""
+    # -- the daemon stores with an explicit export filter and its own command-line, without a
+    # -- filter or with extra `soffice` arguments leave it to the CLI.
+    return (
+        env_config.UNSTRUCTURED_SOFFICE_DAEMON
+        and libre_office_filter is not None
+        and not soffice_extra_args
+        and _SofficeDaemon.get() is not None
+    )
+
+
+def _doc_converter_name(
+    libre_office_filter: Optional[str], soffice_extra_args: Optional[list[str]]
+) -> str:
+    """Name of the program `_run_doc_to_docx_converter()` converts with, given these options."""
+    if (
+        env_config.UNSTRUCTURED_DOC_BACKEND == "lo-pure"
+        and shutil.which("libreoffice-pure") is not None
+    ):
+        return "libreoffice-pure"
+    if _uses_soffice_daemon(libre_office_filter, soffice_extra_args):
+        return "soffice-daemon"
+    return "soffice"
+
+
+def _convert_with_libreoffice_pure(
+    source_file_path: str, target_dir: str, target_file_path: str
+) -> bool:
+    """Convert DOC to DOCX using the `libreoffice-pure` command-line program.
+
+    Returns `False` when the program is not installed or does not produce `target_file_path` so
+    the caller can fall back to LibreOffice.
+    """
+    if shutil.which("libreoffice-pure") is None:
+        logger.warning("libreoffice-pure command was not found, falling back to soffice")
+        return False
+
+    output = subprocess.run(
+        [
+            "libreoffice-pure",
+            "--headless",
+            "--convert-to",
+            "docx",
+            source_file_path,
+            "--outdir",
+            target_dir,
+        ],
+        capture_output=True,
+    )
+    if output.returncode != 0 or not os.path.isfile(target_file_path):
+        logger.warning(
+            "libreoffice-pure failed to convert %s with code %i, falling back to soffice: %s",
+            source_file_path,
+            output.returncode,
+            output.stderr.decode(errors="replace").strip(),
+        )
+        return False
+
+    return True
+
+
+# -- (source content digest, export filter, converter name, extra `soffice` arguments) --
+_CacheKey = Tuple[bytes, Optional[str], str, Tuple[str, ...]]
+
+
+class _ConvertedDocxCache:
+    """Least-recently-used cache of converted DOCX bytes keyed by the source document's content."""
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._entries: OrderedDict[_CacheKey, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: _CacheKey) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    @staticmethod
+    def key(
+        source_file_path: str,
+        libre_office_filter: Optional[str],
+        soffice_extra_args: Optional[list[str]],
+    ) -> _CacheKey:
+        """Cache key for converting DOC file at `source_file_path` with these options.
+
+        The program doing the conversion is part of the key since each produces a different DOCX
+        from the same document.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        with open(source_file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(_COPY_BUFSIZE), b""):
+                hasher.update(chunk)
+        return (
+            hasher.digest(),
+            libre_office_filter,
+            _doc_converter_name(libre_office_filter, soffice_extra_args),
+            tuple(soffice_extra_args or ()),
+        )
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def load(self, key: _CacheKey, target_file_path: str) -> bool:
+        """Write the cached DOCX for `key` to `target_file_path`.
+
+        Returns `False`, writing nothing, when there is no entry for `key`.
+        """
+        with self._lock:
+            docx_bytes = self._entries.get(key)
+            if docx_bytes is None:
+                return False
+            self._entries.move_to_end(key)
+
+        with open(target_file_path, "wb") as f:
+            f.write(docx_bytes)
+        return True
+
+    def store(self, key: _CacheKey, target_file_path: str) -> None:
+        """Add the DOCX file at `target_file_path` to the cache when conversion produced one."""
+        if not os.path.isfile(target_file_path):
+            return
+
+        with open(target_file_path, "rb") as f:
+            docx_bytes = f.read()
+
+        with self._lock:
+            self._entries[key] = docx_bytes
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
+_converted_docx_cache = _ConvertedDocxCache(maxsize=8)
+
+
+class _DeferredDirRemover:
+    """Removes temporary directories on background threads.
+
+    At most `max_pending` removals are in flight at a time, beyond that a directory is removed
+    before `.remove()` returns. Any removal still pending when the interpreter exits is finished
+    then.
+    """
+
+    def __init__(self, max_pending: int):
+        self._max_pending = max_pending
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+        atexit.register(self.remove_pending)
+
+    def remove(self, path: str) -> None:
+        """Remove directory at `path` and everything in it, usually in the background."""
+        with self._lock:
+            defer = len(self._pending) < self._max_pending
+            if defer:
+                self._pending.add(path)
+
+        if not defer:
+            shutil.rmtree(path, ignore_errors=True)
+            return
+
+        threading.Thread(target=self._remove_pending_dir, args=(path,), daemon=True).start()
+
+    def remove_pending(self) -> None:
+        """Remove each directory with a removal still in flight, before returning."""
+        with self._lock:
+            paths = list(self._pending)
+
+        for path in paths:
+            self._remove_pending_dir(path)
+
+    def _remove_pending_dir(self, path: str) -> None:
+        shutil.rmtree(path, ignore_errors=True)
+        with self._lock:
+            self._pending.discard(path)
+
+
+_deferred_dir_remover = _DeferredDirRemover(max_pending=16)
+
+
+class _SofficeDaemon:
+    """A headless `soffice` process that lives as long as this Python process.
+
+    LibreOffice start-up dominates the time it takes to convert a single DOC file. The first
+    conversion launches `soffice` listening on a local socket and each later conversion is sent to
+    that same process over the UNO bridge. This requires the `uno` module that ships with
+    LibreOffice; `.get()` returns `None` when it is not importable or `soffice` cannot be started
+    so the caller can fall back to `convert_office_doc()`.
+    """
+
+    _instance: ClassVar[Optional[_SofficeDaemon]] = None
+    _unavailable: ClassVar[bool] = False
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, process: subprocess.Popen[bytes], desktop: Any, profile_dir: str):
+        self._process = process
+        self._desktop = desktop
+        self._profile_dir = profile_dir
+        self._convert_lock = threading.Lock()
+        # -- a forked child inherits this object but not the `soffice` process, which is only a
+        # -- child process of the Python process that started it.
+        self._pid = os.getpid()
+
+    @classmethod
+    def get(cls) -> Optional[_SofficeDaemon]:
+        """The running daemon for this process, starting it on first use.
+
+        Returns `None` when the daemon cannot be started. A failed start is remembered so it is
+        not attempted again on every call.
+        """
+        with cls._instance_lock:
+            if cls._instance is not None and cls._instance._pid != os.getpid():
+                # -- inherited across `fork()`, the parent still uses that soffice so leave it be
+                # -- and start one for this process.
+                cls._instance = None
+
+            if cls._instance is not None and cls._instance._process.poll() is not None:
+                # -- soffice exited (crashed or was killed), start a fresh one --
+                cls._instance.terminate()
+                cls._instance = None
+
+            if cls._instance is None and not cls._unavailable:
+                if not dependency_exists("uno") or shutil.which("soffice") is None:
+                    # -- the usual case when LibreOffice's Python bindings aren't installed, not
+                    # -- worth a warning since conversion falls back to the `soffice` CLI.
+                    logger.debug(
+                        "soffice daemon not available, `uno` module or `soffice` was not found"
+                    )
+                    cls._unavailable = True
+                    return None
+
+                try:
+                    cls._instance = cls._start()
+                except Exception:
+                    logger.warning("Unable to start soffice daemon", exc_info=True)
+                    cls._unavailable = True
+                else:
+                    atexit.register(cls._instance.terminate)
+
+            return cls._instance
+
+    @classmethod
+    def _start(cls, startup_time_out: float = 30.0) -> _SofficeDaemon:
+        """Launch `soffice` and connect to it over UNO."""
+        import uno
+
+        # -- pick a free local port so daemons in other Python processes don't collide --
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+
+        # -- use a private user-profile so this instance doesn't contend with a user's soffice --
+        profile_dir = tempfile.mkdtemp(prefix="soffice-profile-")
+        process = subprocess.Popen(
+            [
+                "soffice",
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--norestore",
+                "--nofirststartwizard",
+                f"-env:UserInstallation={uno.systemPathToFileUrl(profile_dir)}",
+                f"--accept=socket,host=127.0.0.1,port={port};urp;StarOffice.ServiceManager",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        # -- this soffice has a profile of its own, a conversion by the soffice CLI needn't wait
+        # -- for it to finish.
+        _resident_soffice_pids.add(process.pid)
+
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        uno_url = f"uno:socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext"
+
+        # -- soffice takes a moment to start listening, keep trying until it does --
+        deadline = time.monotonic() + startup_time_out
+        while True:
+            try:
+                context = resolver.resolve(uno_url)
+                break
+            except Exception:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    process.kill()
+                    _resident_soffice_pids.discard(process.pid)
+                    shutil.rmtree(profile_dir, ignore_errors=True)
+                    raise
+                time.sleep(0.1)
+
+        desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+        return cls(process, desktop, profile_dir)
+
+    def convert(self, source_file_path: str, target_file_path: str, filter_name: str) -> None:
+        """Convert document at `source_file_path` to `target_file_path` using `filter_name`."""
+        import uno
+
+        with self._convert_lock:
+            document = self._desktop.loadComponentFromURL(
+                uno.systemPathToFileUrl(os.path.abspath(source_file_path)),
+                "_blank",
+                0,
+                self._property_values(Hidden=True),
+            )
+            try:
+                document.storeToURL(
+                    uno.systemPathToFileUrl(os.path.abspath(target_file_path)),
+                    self._property_values(FilterName=filter_name, Overwrite=True),
+                )
+            finally:
+                document.close(True)
+
+    def terminate(self) -> None:
+        """Shut down the `soffice` process and remove its user-profile.
+
+        Does nothing in a forked child process, the `soffice` process belongs to its parent.
+        """
+        if os.getpid() != self._pid:
+            return
+
+        # -- the UNO bridge is gone when soffice already exited, nothing more to do there --
+        with contextlib.suppress(Exception):
+            self._desktop.terminate()
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+        _resident_soffice_pids.discard(self._process.pid)
+        shutil.rmtree(self._profile_dir, ignore_errors=True)
+
+    @staticmethod
+    def _property_values(**kwargs: Any) -> tuple[Any, ...]:
+        """UNO `PropertyValue` sequence like the keyword-arguments passed."""
+        import uno
+
+        property_values: list[Any] = []
+        for name, value in kwargs.items():
+            property_value = uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+            property_value.Name = name
+            property_value.Value = value
+            property_values.append(property_value)
+        return tuple(property_values)
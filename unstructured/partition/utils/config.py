@@ -214,5 +214,40 @@ class ENVConfig:
         """The format for analysed pages with bboxes drawn on them. Default is 'png'."""
         return self._get_string("ANALYSIS_BBOX_FORMAT", "png")
 
+    @property
+    def UNSTRUCTURED_SOFFICE_DAEMON(self) -> bool:
+        """Convert DOC files with a persistent `soffice` process (when LibreOffice's `uno` module
+        is available) instead of running the `soffice` CLI for each file.
+        """
+        return self._get_bool("UNSTRUCTURED_SOFFICE_DAEMON", True)
+
+    @property
+    def UNSTRUCTURED_DOC_BACKEND(self) -> str:
+        """Program used to convert DOC files to DOCX; "soffice" (LibreOffice) or "lo-pure" to use
+        `libreoffice-pure` when it is installed.
+        """
+        return self._get_string("UNSTRUCTURED_DOC_BACKEND", "soffice")
+
+    @property
+    def UNSTRUCTURED_DOC_CACHE(self) -> bool:
+        """Keep the DOCX converted from recently partitioned DOC files in memory so partitioning
+        the same DOC file again skips the conversion.
+        """
+        return self._get_bool("UNSTRUCTURED_DOC_CACHE", True)
+
+    @property
+    def UNSTRUCTURED_DOC_PARALLEL(self) -> bool:
+        """Divide a batch of DOC files among concurrent `soffice` processes, up to one per CPU,
+        when converting them to DOCX.
+        """
+        return self._get_bool("UNSTRUCTURED_DOC_PARALLEL", False)
+
+    @property
+    def UNSTRUCTURED_TMPDIR(self) -> str:
+        """Directory for the temporary files of DOC -> DOCX conversion. When empty, `/dev/shm` is
+        used if available, otherwise the default temporary directory.
+        """
+        return self._get_string("UNSTRUCTURED_TMPDIR", "")
+
 
 env_config = ENVConfig()